@@ -46,3 +46,10 @@ try:
     _IMBLEARN_INSTALLED = True
 except ImportError:
     _IMBLEARN_INSTALLED = False
+
+
+try:
+    import numexpr                  # noqa
+    _NUMEXPR_INSTALLED = True
+except ImportError:
+    _NUMEXPR_INSTALLED = False
@@ -1,10 +1,39 @@
 #!/usr/bin/env python
 
 import importlib
+import operator
 
 # import pandas.compat as compat
 
 
+class _cached_accessor(object):
+    """
+    Decorator to cache an accessor instance, similar to ``cache_readonly``.
+
+    The accessor is stored to the instance ``__dict__`` under the decorated
+    name and returned by subsequent lookups. Setting the attribute raises
+    ``AttributeError`` like a property without setter.
+    """
+
+    def __init__(self, func, name=None, doc=None):
+        self.func = func
+        self.name = func.__name__ if name is None else name
+        self.__doc__ = func.__doc__ if doc is None else doc
+
+    def __get__(self, obj, typ=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            accessor = self.func(obj)
+            obj.__dict__[self.name] = accessor
+            return accessor
+
+    def __set__(self, obj, value):
+        raise AttributeError("can't set attribute '{0}'".format(self.name))
+
+
 class _AccessorMethods(object):
     """
     Accessor to related functionalities.
@@ -102,6 +131,24 @@ def _attach_methods(cls, wrap_func, methods):
         pass
 
 
+def _attach_accessors(cls, accessors):
+    """
+    Attach cached accessors to cls
+
+    Parameters
+    ----------
+    cls : class to attach accessors
+    accessors : list of tuple
+        (name, function to create accessor from cls instance, docstring, aliases)
+    """
+    for name, func, doc, aliases in accessors:
+        setattr(cls, name, _cached_accessor(func, name=name, doc=doc))
+        # aliases refer to the same accessor instance
+        for alias in aliases:
+            setattr(cls, alias, _cached_accessor(operator.attrgetter(name),
+                                                 name=alias, doc=doc))
+
+
 def _wrap_data_func(func, func_name):
     """
     Wrapper to call func with data values
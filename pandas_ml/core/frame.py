@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import functools
 import warnings
 
 import numpy as np
@@ -12,11 +13,30 @@ import pandas_ml.smaccessors as smaccessors
 import pandas_ml.snsaccessors as snsaccessors
 import pandas_ml.util as util
 import pandas_ml.xgboost as xgboost
-from pandas_ml.compat import is_list_like, Appender, cache_readonly
-from pandas_ml.core.accessor import _AccessorMethods
+from pandas_ml.compat import is_list_like, Appender, _PANDAS_ge_110
+from pandas_ml.core.accessor import _AccessorMethods, _attach_accessors
 from pandas_ml.core.generic import ModelPredictor, _shared_docs
 from pandas_ml.core.series import ModelSeries
 
+# default for methods which have no mapping, see _get_method_mapper
+_EMPTY = {}
+
+
+def _cache_data(func):
+    """
+    Decorator to define a property whose value is stored in the cache
+    returned by ``ModelFrame._get_data_cache``
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        cache = self._get_data_cache()
+        if name not in cache:
+            cache[name] = func(self)
+        return cache[name]
+    return property(wrapper)
+
 
 class ModelFrame(ModelPredictor, pd.DataFrame):
     """
@@ -28,15 +48,23 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
     data : same as ``pandas.DataFrame``
     target : str or array-like
         Column name or values to be used as target
+    memory_efficient : bool, default False
+        Downcast numeric data and target to the smallest dtype which can hold
+        the values without loss, to reduce memory passed to estimators.
+        Estimators which require float64 convert values by themselves.
     args : arguments passed to ``pandas.DataFrame``
     kwargs : keyword arguments passed to ``pandas.DataFrame``
     """
 
-    _internal_caches = ['_estimator', '_predicted', '_proba', '_log_proba', '_decision']
+    _internal_caches = ['_estimator', '_predicted', '_proba', '_log_proba', '_decision',
+                        '_warned_auto', '_data_cache']
     _internal_names = (pd.core.generic.NDFrame._internal_names + _internal_caches)
     _internal_names_set = set(_internal_names)
     _metadata = ['_target_name']
 
+    # values derived from columns and target_name, see _get_data_cache
+    _data_cache = None
+
     _method_mapper = dict(fit={}, transform={}, predict={})
     for cls in [skaccessors.CrossDecompositionMethods,
                 skaccessors.GaussianProcessMethods]:
@@ -61,15 +89,37 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
             msg = 'target must be list-like when data is None'
             raise ValueError(msg)
 
-        data, target = skaccessors._maybe_sklearn_data(data, target)
-        data, target = smaccessors._maybe_statsmodels_data(data, target)
+        if target is None and not args and not kwargs:
+            # no conversion required
+            if isinstance(data, ModelFrame):
+                self._target_name = data.target_name
+                pd.DataFrame.__init__(self, data)
+                return
+            elif isinstance(data, pd.core.internals.BlockManager):
+                # passed via _constructor, target_name is set by __finalize__
+                self._target_name = self._TARGET_NAME
+                pd.DataFrame.__init__(self, data)
+                return
+
+        if not isinstance(data, (pd.DataFrame, np.ndarray)):
+            data, target = skaccessors._maybe_sklearn_data(data, target)
+            data, target = smaccessors._maybe_statsmodels_data(data, target)
 
         # retrieve target_name
         if isinstance(data, ModelFrame):
             target_name = data.target_name
+        else:
+            target_name = self._TARGET_NAME
 
+        memory_efficient = kwargs.pop('memory_efficient', False)
         data, target = self._maybe_convert_data(data, target, *args, **kwargs)
 
+        if memory_efficient:
+            if data is not None:
+                data = util._downcast_numeric(data)
+            if isinstance(target, (pd.Series, pd.DataFrame)):
+                target = util._downcast_numeric(target)
+
         if target is not None and not is_list_like(target):
             if target in data.columns:
                 target_name = target
@@ -91,10 +141,49 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
                     self._target_name = target.columns[0]
             else:
                 # target may be None
-                self._target_name = self._TARGET_NAME
+                self._target_name = target_name
 
         pd.DataFrame.__init__(self, df)
 
+    @classmethod
+    def from_arrays(cls, X, y, feature_names=None, target_name=None):
+        """
+        Create ``ModelFrame`` from data and target arrays
+
+        Parameters
+        ----------
+        X : 2-dimensional array-like
+            Data (explanatory variable / features)
+        y : 1-dimensional array-like
+            Target (response variable)
+        feature_names : list-like, optional
+            Column names of data, default ``RangeIndex``
+        target_name : object, optional
+            Column name of target, default '.target'
+
+        Returns
+        -------
+        frame : ``ModelFrame``
+        """
+        X = np.asarray(X)
+        y = np.asarray(y)
+        if X.ndim != 2:
+            raise ValueError('X must be 2-dimensional')
+        if y.ndim != 1:
+            raise ValueError('y must be 1-dimensional')
+        if len(X) != len(y):
+            raise ValueError('data and target must have same length')
+
+        if target_name is None:
+            target_name = cls._TARGET_NAME
+
+        # skip conversions of data and target in __init__
+        df = pd.DataFrame(X, columns=feature_names, copy=True)
+        if target_name in df.columns:
+            raise ValueError('data and target must have unique names')
+        df.insert(0, target_name, y)
+        return cls(df, target=target_name)
+
     def _maybe_convert_data(self, data, target,
                             *args, **kwargs):
         """
@@ -114,10 +203,13 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         def _maybe_convert_target(data, target, index=None):
             if data is not None:
                 index = data.index
-
-            target = np.array(target)
+                # values are copied when concatenated with data,
+                # avoid to copy ndarray here
+                target = np.asarray(target)
+            else:
+                target = np.array(target)
             if len(target.shape) == 1:
-                target = pd.Series(target, index=index)
+                target = pd.Series(target, index=index, name=self._TARGET_NAME)
             else:
                 target = pd.DataFrame(target, index=index)
             return target
@@ -177,13 +269,21 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
                 data = _add_meta_columns(data, self._DATA_NAME)
                 # overwrite target_name
                 self._target_name = target.columns
+            return pd.concat([target, data], axis=1), target
         elif isinstance(target, pd.Series):
             if target.name in data.columns:
                 raise ValueError('data and target must have unique names')
         else:
             raise ValueError('target cannot be converted to ModelSeries or ModelFrame')
 
-        return pd.concat([target, data], axis=1), target
+        if isinstance(data.columns, pd.MultiIndex):
+            # DataFrame.insert pads target name to a tuple
+            return pd.concat([target, data], axis=1), target
+
+        # index is already checked, insert target to skip alignment in pd.concat
+        df = data.copy()
+        df.insert(0, target.name, target)
+        return df, target
 
     def has_data(self):
         """
@@ -195,15 +295,76 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         """
         return len(self._data_columns) > 0
 
-    @property
+    def _get_data_cache(self):
+        """
+        Return dict to cache values derived from data and target.
+
+        The cache is bound to the current columns and target_name. Because
+        ``Index`` is immutable, a new columns object is assigned whenever
+        columns are added, removed or renamed.
+        """
+        cache = self._data_cache
+        if (cache is None or cache['columns'] is not self.columns
+                or cache['target_name'] is not self._target_name):
+            cache = dict(columns=self.columns, target_name=self._target_name)
+            self._data_cache = cache
+        return cache
+
+    def _clear_data_cache(self):
+        self._data_cache = None
+
+    def _update_inplace(self, *args, **kwargs):
+        self._clear_data_cache()
+        return pd.DataFrame._update_inplace(self, *args, **kwargs)
+
+    @_cache_data
     def _data_columns(self):
-        # Index.difference results in sorted difference set
+        if not self.has_target():
+            return self.columns
         if self.has_multi_targets():
-            return self.columns[~self.columns.isin(self.target_name)]
-        else:
-            # This doesn't work for DatetimeIndex
-            # return self.columns[~(self.columns == self.target_name)]
-            return pd.Index([c for c in self.columns if c != self.target_name])
+            # Index.difference results in sorted difference set
+            return self.columns.drop(self.target_name, errors='ignore')
+
+        # int, slice or boolean mask if columns are duplicated
+        loc = self.columns.get_loc(self.target_name)
+        if isinstance(loc, np.ndarray):
+            return self.columns[~loc]
+        return self.columns.delete(loc)
+
+    @property
+    def _features_ndarray(self):
+        """
+        Return data values as a new ``np.ndarray`` passed to estimators.
+        The result is not cached, because estimators may modify it inplace and
+        values can be modified without notifying ``ModelFrame``.
+        """
+        if not self.has_data():
+            return None
+
+        values = None
+        mgr = self._mgr if _PANDAS_ge_110 else None
+        if hasattr(mgr, 'blknos') and self.columns.is_unique:
+            # take values from the block directly if all data columns
+            # are stored in a single block, to avoid slicing ModelFrame.
+            # indexing with blklocs results in a copy
+            locs = self.columns.get_indexer(self._data_columns)
+            blknos = mgr.blknos[locs]
+            if (blknos == blknos[0]).all():
+                block_values = mgr.blocks[blknos[0]].values
+                if isinstance(block_values, np.ndarray) and block_values.ndim == 2:
+                    values = block_values[mgr.blklocs[locs]].T
+        if values is None:
+            values = self.data.values
+        return values
+
+    @property
+    def _target_ndarray(self):
+        """
+        Return target values passed to estimators
+        """
+        if not self.has_target():
+            return None
+        return self.target.values
 
     @property
     def data(self):
@@ -268,6 +429,10 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         -------
         has_target : bool
         """
+        return self._has_target
+
+    @_cache_data
+    def _has_target(self):
         if self.has_multi_targets():
             return len(self.target_name.intersection(self.columns)) > 0
         return self.target_name in self.columns
@@ -296,6 +461,7 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
     @target_name.setter
     def target_name(self, value):
         self._target_name = value
+        self._clear_data_cache()
 
     @property
     def target(self):
@@ -356,9 +522,22 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         else:
             _, target = self._maybe_convert_data(self.data, target, self.target_name)
 
+        if (isinstance(target, pd.Series) and self._has_single_leading_target()
+                and target.name == self.target_name and target.index.equals(self.index)):
+            # replace target column values, without reconstructing ModelFrame
+            self[self.target_name] = target
+            return
+
         df, _ = self._concat_target(self.data, target)
         self._update_inplace(df)
 
+    def _has_single_leading_target(self):
+        # whether ModelFrame has a single target as the first column,
+        # the layout created by _concat_target
+        if self.has_multi_targets() or not self.has_target():
+            return False
+        return self.columns.is_unique and self.columns.get_loc(self.target_name) == 0
+
     @target.deleter
     def target(self):
         if self.has_data():
@@ -368,16 +547,15 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
             raise ValueError(msg.format(self.__class__.__name__))
 
     def _get_method_mapper(self, estimator, method_name):
-        if method_name in self._method_mapper:
-            mapper = self._method_mapper[method_name]
-        return mapper.get(estimator.__class__.__name__, None)
+        mapper = self._method_mapper.get(method_name, _EMPTY)
+        return mapper.get(estimator.__class__.__name__)
 
     def _call(self, estimator, method_name, *args, **kwargs):
         method = self._check_attr(estimator, method_name)
 
-        data = self.data.values
+        data = self._features_ndarray
         if self.has_target():
-            target = self.target.values
+            target = self._target_ndarray
             try:
                 result = method(data, y=target, *args, **kwargs)
             except TypeError:
@@ -404,10 +582,21 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         if util._is_1d_varray(predicted):
             predicted = self._constructor_sliced(predicted, index=self.index)
         else:
-            predicted = self._constructor(predicted, index=self.index)
+            predicted = self._wrap_ndarray(predicted)
         self._predicted = predicted
         return self._predicted
 
+    def _wrap_ndarray(self, values, columns=None):
+        """
+        Wrapper to create ``ModelFrame`` without target from estimator's output
+        """
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+            # numeric ndarray is stored as a single block, pass BlockManager
+            # to skip conversions in ModelFrame.__init__
+            df = pd.DataFrame(values, index=self.index, columns=columns)
+            return self._constructor(df._mgr if _PANDAS_ge_110 else df._data)
+        return self._constructor(values, index=self.index, columns=columns)
+
     @Appender(_shared_docs['estimator_methods'] %
               dict(funcname='fit_sample', returned='returned : sampling result'))
     def fit_sample(self, estimator, *args, **kwargs):
@@ -528,10 +717,10 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         try:
             if util._is_1d_varray(probability):
                 # 2 class
-                probability = self._constructor(probability, index=self.index)
+                probability = self._wrap_ndarray(probability)
             else:
-                probability = self._constructor(probability, index=self.index,
-                                                columns=estimator.classes_)
+                probability = self._wrap_ndarray(probability,
+                                                 columns=estimator.classes_)
         except ValueError:
             msg = "Unable to instantiate ModelFrame for '{0}'"
             warnings.warn(msg.format(estimator.__class__.__name__))
@@ -543,366 +732,21 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         score = self._call(estimator, 'score', *args, **kwargs)
         return score
 
-    # accessors
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] %
-              dict(module='calibration'))
-    def calibration(self):
-        return self._calibration
-
-    @cache_readonly
-    def _calibration(self):
-        attrs = ['CalibratedClassifierCV']
-        return _AccessorMethods(self, module_name='sklearn.calibration',
-                                attrs=attrs)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='cluster'))
-    def cluster(self):
-        return self._cluster
-
-    @cache_readonly
-    def _cluster(self):
-        return skaccessors.ClusterMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='covariance'))
-    def covariance(self):
-        return self._covariance
-
-    @cache_readonly
-    def _covariance(self):
-        return skaccessors.CovarianceMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='cross_decomposition'))
-    def cross_decomposition(self):
-        return self._cross_decomposition
-
-    @cache_readonly
-    def _cross_decomposition(self):
-        attrs = ['PLSRegression', 'PLSCanonical', 'CCA', 'PLSSVD']
-        return _AccessorMethods(self, module_name='sklearn.cross_decomposition',
-                                attrs=attrs)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='decomposition'))
-    def decomposition(self):
-        return self._decomposition
-
-    @cache_readonly
-    def _decomposition(self):
-        return skaccessors.DecompositionMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] %
-              dict(module='discriminant_analysis'))
-    def discriminant_analysis(self):
-        return self._da
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] %
-              dict(module='discriminant_analysis'))
-    def da(self):
-        return self._da
-
-    @cache_readonly
-    def _da(self):
-        return _AccessorMethods(self,
-                                module_name='sklearn.discriminant_analysis')
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='dummy'))
-    def dummy(self):
-        return self._dummy
-
-    @cache_readonly
-    def _dummy(self):
-        attrs = ['DummyClassifier', 'DummyRegressor']
-        return _AccessorMethods(self, module_name='sklearn.dummy', attrs=attrs)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='ensemble'))
-    def ensemble(self):
-        return self._ensemble
-
-    @cache_readonly
-    def _ensemble(self):
-        return skaccessors.EnsembleMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='feature_extraction'))
-    def feature_extraction(self):
-        return self._feature_extraction
-
-    @cache_readonly
-    def _feature_extraction(self):
-        return skaccessors.FeatureExtractionMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='feature_selection'))
-    def feature_selection(self):
-        return self._feature_selection
-
-    @cache_readonly
-    def _feature_selection(self):
-        return skaccessors.FeatureSelectionMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='gaussian_process'))
-    def gaussian_process(self):
-        return self._gaussian_process
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='gaussian_process'))
-    def gp(self):
-        return self._gaussian_process
-
-    @cache_readonly
-    def _gaussian_process(self):
-        return skaccessors.GaussianProcessMethods(self)
-
-    @property
-    def imbalance(self):
-        """ Property to access ``imblearn``"""
-        return self._imbalance
-
-    @cache_readonly
-    def _imbalance(self):
-        return imbaccessors.ImbalanceMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='isotonic'))
-    def isotonic(self):
-        return self._isotonic
-
-    @cache_readonly
-    def _isotonic(self):
-        return skaccessors.IsotonicMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='kernel_approximation'))
-    def kernel_approximation(self):
-        return self._kernel_approximation
-
-    @cache_readonly
-    def _kernel_approximation(self):
-        attrs = ['AdditiveChi2Sampler', 'Nystroem', 'RBFSampler', 'SkewedChi2Sampler']
-        return _AccessorMethods(self, module_name='sklearn.kernel_approximation',
-                                attrs=attrs)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='kernel_ridge'))
-    def kernel_ridge(self):
-        return self._kernel_ridge
-
-    @cache_readonly
-    def _kernel_ridge(self):
-        attrs = ['KernelRidge']
-        return _AccessorMethods(self, module_name='sklearn.kernel_ridge',
-                                attrs=attrs)
+    # accessors, see _accessors for others
 
     @property
     @Appender(_shared_docs['skaccessor_nolink'] % dict(module='lda'))
     def lda(self):
         msg = '.lda is deprecated. Use .da or .diccriminant_analysis'
         warnings.warn(msg, FutureWarning, stacklevel=2)
-        return self._da
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='linear_model'))
-    def linear_model(self):
-        return self._linear_model
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='linear_model'))
-    def lm(self):
-        return self._linear_model
-
-    @cache_readonly
-    def _linear_model(self):
-        return skaccessors.LinearModelMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='manifold'))
-    def manifold(self):
-        return self._manifold
-
-    @cache_readonly
-    def _manifold(self):
-        return skaccessors.ManifoldMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='metrics'))
-    def metrics(self):
-        return self._metrics
-
-    @cache_readonly
-    def _metrics(self):
-        return skaccessors.MetricsMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='mixture'))
-    def mixture(self):
-        return self._mixture
-
-    @cache_readonly
-    def _mixture(self):
-        return _AccessorMethods(self, module_name='sklearn.mixture')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='model_selection'))
-    def model_selection(self):
-        return self._model_selection
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='model_selection'))
-    def ms(self):
-        return self._model_selection
-
-    @cache_readonly
-    def _model_selection(self):
-        return skaccessors.ModelSelectionMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='multiclass'))
-    def multiclass(self):
-        return self._multiclass
-
-    @cache_readonly
-    def _multiclass(self):
-        return _AccessorMethods(self, module_name='sklearn.multiclass')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='multioutput'))
-    def multioutput(self):
-        return self._multioutput
-
-    @cache_readonly
-    def _multioutput(self):
-        return _AccessorMethods(self, module_name='sklearn.multioutput')
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='naive_bayes'))
-    def naive_bayes(self):
-        return self._naive_bayes
-
-    @cache_readonly
-    def _naive_bayes(self):
-        return _AccessorMethods(self, module_name='sklearn.naive_bayes')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='neighbors'))
-    def neighbors(self):
-        return self._neighbors
-
-    @cache_readonly
-    def _neighbors(self):
-        return skaccessors.NeighborsMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='neural_network'))
-    def neural_network(self):
-        return self._neural_network
-
-    @cache_readonly
-    def _neural_network(self):
-        return _AccessorMethods(self, module_name='sklearn.neural_network')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='pipeline'))
-    def pipeline(self):
-        return self._pipeline
-
-    @cache_readonly
-    def _pipeline(self):
-        return skaccessors.PipelineMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='preprocessing'))
-    def preprocessing(self):
-        return self._preprocessing
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='preprocessing'))
-    def pp(self):
-        return self.preprocessing
-
-    @cache_readonly
-    def _preprocessing(self):
-        return skaccessors.PreprocessingMethods(self)
+        return self.discriminant_analysis
 
     @property
     @Appender(_shared_docs['skaccessor_nolink'] % dict(module='qda'))
     def qda(self):
         msg = '.qda is deprecated. Use .da or .diccriminant_analysis'
         warnings.warn(msg, FutureWarning, stacklevel=2)
-        return self._da
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='random_projection'))
-    def random_projection(self):
-        return self._random_projection
-
-    @cache_readonly
-    def _random_projection(self):
-        return _AccessorMethods(self, module_name='sklearn.random_projection')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='semi_supervised'))
-    def semi_supervised(self):
-        return self._semi_supervised
-
-    @cache_readonly
-    def _semi_supervised(self):
-        return _AccessorMethods(self, module_name='sklearn.semi_supervised')
-
-    @property
-    @Appender(_shared_docs['skaccessor'] % dict(module='svm'))
-    def svm(self):
-        return self._svm
-
-    @cache_readonly
-    def _svm(self):
-        return skaccessors.SVMMethods(self)
-
-    @property
-    @Appender(_shared_docs['skaccessor_nolink'] % dict(module='tree'))
-    def tree(self):
-        return self._tree
-
-    @cache_readonly
-    def _tree(self):
-        return _AccessorMethods(self, module_name='sklearn.tree')
-
-    @property
-    def sns(self):
-        """Property to access ``seaborn`` API"""
-        return self._seaborn
-
-    @property
-    def seaborn(self):
-        """Property to access ``seaborn`` API"""
-        return self._seaborn
-
-    @cache_readonly
-    def _seaborn(self):
-        return snsaccessors.SeabornMethods(self)
-
-    @property
-    def xgb(self):
-        """Property to access ``xgboost.sklearn`` API"""
-        return self._xgboost
-
-    @property
-    def xgboost(self):
-        """Property to access ``xgboost.sklearn`` API"""
-        return self._xgboost
-
-    @cache_readonly
-    def _xgboost(self):
-        return xgboost.XGBoostMethods(self)
+        return self.discriminant_analysis
 
    # @Appender(pd.core.generic.NDFrame.groupby.__doc__)
     @Appender(pd.DataFrame.groupby.__doc__)
@@ -914,3 +758,77 @@ class ModelFrame(ModelPredictor, pd.DataFrame):
         axis = self._get_axis_number(axis)
         return groupby(self, by=by, axis=axis, level=level, as_index=as_index,
                        sort=sort, group_keys=group_keys, squeeze=squeeze)
+
+
+def _sklearn_accessor(module_name, attrs=None):
+    def f(df):
+        return _AccessorMethods(df, module_name=module_name, attrs=attrs)
+    return f
+
+
+def _sklearn_doc(module, link=True):
+    key = 'skaccessor' if link else 'skaccessor_nolink'
+    return _shared_docs[key] % dict(module=module)
+
+
+# (name, function to create accessor, docstring, aliases)
+_accessors = [
+    ('calibration',
+     _sklearn_accessor('sklearn.calibration', attrs=['CalibratedClassifierCV']),
+     _sklearn_doc('calibration', link=False), []),
+    ('cluster', skaccessors.ClusterMethods, _sklearn_doc('cluster'), []),
+    ('covariance', skaccessors.CovarianceMethods, _sklearn_doc('covariance'), []),
+    ('cross_decomposition',
+     _sklearn_accessor('sklearn.cross_decomposition',
+                       attrs=['PLSRegression', 'PLSCanonical', 'CCA', 'PLSSVD']),
+     _sklearn_doc('cross_decomposition', link=False), []),
+    ('decomposition', skaccessors.DecompositionMethods,
+     _sklearn_doc('decomposition', link=False), []),
+    ('discriminant_analysis', _sklearn_accessor('sklearn.discriminant_analysis'),
+     _sklearn_doc('discriminant_analysis', link=False), ['da']),
+    ('dummy',
+     _sklearn_accessor('sklearn.dummy', attrs=['DummyClassifier', 'DummyRegressor']),
+     _sklearn_doc('dummy', link=False), []),
+    ('ensemble', skaccessors.EnsembleMethods, _sklearn_doc('ensemble'), []),
+    ('feature_extraction', skaccessors.FeatureExtractionMethods,
+     _sklearn_doc('feature_extraction'), []),
+    ('feature_selection', skaccessors.FeatureSelectionMethods,
+     _sklearn_doc('feature_selection'), []),
+    ('gaussian_process', skaccessors.GaussianProcessMethods,
+     _sklearn_doc('gaussian_process'), ['gp']),
+    ('imbalance', imbaccessors.ImbalanceMethods,
+     """ Property to access ``imblearn``""", []),
+    ('isotonic', skaccessors.IsotonicMethods, _sklearn_doc('isotonic'), []),
+    ('kernel_approximation',
+     _sklearn_accessor('sklearn.kernel_approximation',
+                       attrs=['AdditiveChi2Sampler', 'Nystroem', 'RBFSampler',
+                              'SkewedChi2Sampler']),
+     _sklearn_doc('kernel_approximation', link=False), []),
+    ('kernel_ridge', _sklearn_accessor('sklearn.kernel_ridge', attrs=['KernelRidge']),
+     _sklearn_doc('kernel_ridge', link=False), []),
+    ('linear_model', skaccessors.LinearModelMethods, _sklearn_doc('linear_model'), ['lm']),
+    ('manifold', skaccessors.ManifoldMethods, _sklearn_doc('manifold'), []),
+    ('metrics', skaccessors.MetricsMethods, _sklearn_doc('metrics'), []),
+    ('mixture', _sklearn_accessor('sklearn.mixture'),
+     _sklearn_doc('mixture', link=False), []),
+    ('model_selection', skaccessors.ModelSelectionMethods,
+     _sklearn_doc('model_selection'), ['ms']),
+    ('multiclass', _sklearn_accessor('sklearn.multiclass'), _sklearn_doc('multiclass'), []),
+    ('multioutput', _sklearn_accessor('sklearn.multioutput'), _sklearn_doc('multioutput'), []),
+    ('naive_bayes', _sklearn_accessor('sklearn.naive_bayes'),
+     _sklearn_doc('naive_bayes', link=False), []),
+    ('neighbors', skaccessors.NeighborsMethods, _sklearn_doc('neighbors'), []),
+    ('neural_network', _sklearn_accessor('sklearn.neural_network'),
+     _sklearn_doc('neural_network', link=False), []),
+    ('pipeline', skaccessors.PipelineMethods, _sklearn_doc('pipeline'), []),
+    ('preprocessing', skaccessors.PreprocessingMethods, _sklearn_doc('preprocessing'), ['pp']),
+    ('random_projection', _sklearn_accessor('sklearn.random_projection'),
+     _sklearn_doc('random_projection'), []),
+    ('semi_supervised', _sklearn_accessor('sklearn.semi_supervised'),
+     _sklearn_doc('semi_supervised'), []),
+    ('svm', skaccessors.SVMMethods, _sklearn_doc('svm'), []),
+    ('tree', _sklearn_accessor('sklearn.tree'), _sklearn_doc('tree', link=False), []),
+    ('seaborn', snsaccessors.SeabornMethods, """Property to access ``seaborn`` API""", ['sns']),
+    ('xgboost', xgboost.XGBoostMethods, """Property to access ``xgboost.sklearn`` API""", ['xgb']),
+]
+_attach_accessors(ModelFrame, _accessors)
@@ -24,10 +24,13 @@ class ModelTransformer(object):
     """
 
     def _check_attr(self, estimator, method_name):
-        if not hasattr(estimator, method_name):
+        # availability of some methods depends on estimator parameters,
+        # thus the lookup can't be cached per class
+        method = getattr(estimator, method_name, None)
+        if method is None:
             msg = "class {0} doesn't have {1} method"
             raise ValueError(msg.format(type(estimator), method_name))
-        return getattr(estimator, method_name)
+        return method
 
     def _call(self, estimator, method_name, *args, **kwargs):
         # must be overrided
@@ -123,6 +126,16 @@ class ModelPredictor(ModelTransformer):
             self._log_proba = None
             self._decision = None
 
+    def _warn_automatic_call(self, msg):
+        # warn once per method and estimator class, as warnings.warn
+        # is costly when properties are accessed repeatedly
+        if not hasattr(self, '_warned_auto') or self._warned_auto is None:
+            self._warned_auto = set()
+        key = (msg, self.estimator.__class__)
+        if key not in self._warned_auto:
+            warnings.warn(msg.format(self.estimator.__class__.__name__))
+            self._warned_auto.add(key)
+
     @property
     def predicted(self):
         """
@@ -135,7 +148,7 @@ class ModelPredictor(ModelTransformer):
         if not hasattr(self, '_predicted') or self._predicted is None:
             self._predicted = self.predict(self.estimator)
             msg = "Automatically call '{0}.predict()'' to get predicted results"
-            warnings.warn(msg.format(self.estimator.__class__.__name__))
+            self._warn_automatic_call(msg)
         return self._predicted
 
     @property
@@ -150,7 +163,7 @@ class ModelPredictor(ModelTransformer):
         if not hasattr(self, '_proba') or self._proba is None:
             self._proba = self.predict_proba(self.estimator)
             msg = "Automatically call '{0}.predict_proba()' to get probabilities"
-            warnings.warn(msg.format(self.estimator.__class__.__name__))
+            self._warn_automatic_call(msg)
         return self._proba
 
     @property
@@ -165,7 +178,7 @@ class ModelPredictor(ModelTransformer):
         if not hasattr(self, '_log_proba') or self._log_proba is None:
             self._log_proba = self.predict_log_proba(self.estimator)
             msg = "Automatically call '{0}.predict_log_proba()' to get log probabilities"
-            warnings.warn(msg.format(self.estimator.__class__.__name__))
+            self._warn_automatic_call(msg)
         return self._log_proba
 
     @property
@@ -180,7 +193,7 @@ class ModelPredictor(ModelTransformer):
         if not hasattr(self, '_decision') or self._decision is None:
             self._decision = self.decision_function(self.estimator)
             msg = "Automatically call '{0}.decition_function()' to get decision function"
-            warnings.warn(msg.format(self.estimator.__class__.__name__))
+            self._warn_automatic_call(msg)
         return self._decision
 
     @Appender(_shared_docs['estimator_methods'] %
@@ -28,7 +28,8 @@ class ModelSeriesGroupBy(pd.core.groupby.SeriesGroupBy):
 
 class ModelFrameGroupBy(pd.core.groupby.DataFrameGroupBy, ModelPredictor):
 
-    _internal_caches = ['_estimator', '_predicted', '_proba', '_log_proba', '_decision']
+    _internal_caches = ['_estimator', '_predicted', '_proba', '_log_proba', '_decision',
+                        '_warned_auto']
     _internal_names = pd.core.groupby.DataFrameGroupBy._internal_names + _internal_caches
     _internal_names_set = set(_internal_names)
 
@@ -40,8 +41,8 @@ class ModelFrameGroupBy(pd.core.groupby.DataFrameGroupBy, ModelPredictor):
         else:
             return pd.core.groupby.DataFrameGroupBy.transform(self, func, *args, **kwargs)
 
-    def _get_mapper(self, estimator, method_name):
-        # mappings are handled by ModelFrame._get_mapper
+    def _get_method_mapper(self, estimator, method_name):
+        # mappings are handled by ModelFrame._get_method_mapper
         return None
 
     def _call(self, estimator, method_name, *args, **kwargs):
@@ -4,7 +4,8 @@ import pandas as pd
 
 import pandas_ml.skaccessors as skaccessors
 import pandas_ml.util as util
-from pandas_ml.compat import Appender, cache_readonly
+from pandas_ml.compat import Appender
+from pandas_ml.core.accessor import _cached_accessor
 from pandas_ml.core.generic import ModelTransformer, _shared_docs
 
 
@@ -61,7 +62,7 @@ class ModelSeries(ModelTransformer, pd.Series):
     def pp(self):
         return self._preprocessing
 
-    @cache_readonly
+    @_cached_accessor
     def _preprocessing(self):
         return skaccessors.PreprocessingMethods(self)
 
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+from pandas_ml.compat import _NUMEXPR_INSTALLED
 from pandas_ml.core.accessor import (_AccessorMethods, _attach_methods,
                                      _wrap_target_pred_func,
                                      _wrap_target_pred_noargs)
@@ -201,7 +202,32 @@ class MetricsMethods(_AccessorMethods):
         return self._curve_wraps(func, *args, **kwargs)
 
     # Regression metrics
-    # None
+
+    def residual(self):
+        """
+        Calcurate residuals, target minus predicted values.
+        ``numexpr`` is used if installed.
+
+        - ``y_true``: ``ModelFrame.target``
+        - ``y_pred``: ``ModelFrame.predicted``
+
+        Returns
+        -------
+        residual : ``ModelSeries`` or ``ModelFrame``
+        """
+        y = self._target.values
+        p = self._predicted.values
+        if (_NUMEXPR_INSTALLED and y.dtype.kind in 'biuf'
+                and p.dtype.kind in 'biuf'):
+            import numexpr as ne
+            result = ne.evaluate('y - p', local_dict=dict(y=y, p=p))
+        else:
+            result = y - p
+
+        if result.ndim == 1:
+            return self._constructor_sliced(result, index=self._df.index)
+        return self._constructor(result, index=self._df.index,
+                                 columns=self._target.columns)
 
     # Clusteing metrics
 
@@ -482,6 +482,49 @@ class TestRegressionMetrics(tm.TestCase):
         expected = metrics.r2_score(self.target, self.pred)
         self.assertEqual(result, expected)
 
+    def test_residual(self, monkeypatch):
+        # numpy is used if numexpr is not installed
+        import pandas_ml.skaccessors.metrics as skmetrics
+        monkeypatch.setattr(skmetrics, '_NUMEXPR_INSTALLED', False)
+
+        result = self.df.metrics.residual()
+        expected = self.target - self.pred
+        self.assertIsInstance(result, pdml.ModelSeries)
+        tm.assert_index_equal(result.index, self.df.index)
+        self.assert_numpy_array_almost_equal(result.values, expected)
+
+    def test_residual_numexpr(self):
+        pytest.importorskip('numexpr')
+        import pandas_ml.skaccessors.metrics as skmetrics
+        self.assertTrue(skmetrics._NUMEXPR_INSTALLED)
+
+        result = self.df.metrics.residual()
+        expected = self.target - self.pred
+        self.assertIsInstance(result, pdml.ModelSeries)
+        tm.assert_index_equal(result.index, self.df.index)
+        self.assert_numpy_array_almost_equal(result.values, expected)
+
+    def test_residual_multi_targets(self):
+        from sklearn import linear_model
+        data = np.array([[0., 1.], [1., 0.], [2., 2.], [3., 1.]])
+        target = np.array([[0., 1.], [1., 2.], [2., 2.], [4., 1.]])
+
+        df = pdml.ModelFrame(data=data, target=target)
+        self.assertTrue(df.has_multi_targets())
+        estimator1 = linear_model.LinearRegression()
+        df.fit(estimator1)
+        df.predict(estimator1)
+
+        estimator2 = linear_model.LinearRegression()
+        estimator2.fit(data, target)
+        expected = target - estimator2.predict(data)
+
+        result = df.metrics.residual()
+        self.assertIsInstance(result, pdml.ModelFrame)
+        tm.assert_index_equal(result.index, df.index)
+        tm.assert_index_equal(result.columns, df.target.columns)
+        self.assert_numpy_array_almost_equal(result.values, expected)
+
 
 class TestClusteringMetrics(tm.TestCase):
 
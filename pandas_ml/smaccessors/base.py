@@ -6,6 +6,11 @@ from pandas_ml.core import base
 
 
 def _maybe_statsmodels_data(data, target):
+    if not isinstance(data, dict):
+        # statsmodels Dataset is a dict subclass, avoid trying to import
+        # statsmodels which is slow when it is not installed
+        return data, target
+
     try:
         import statsmodels.datasets as datasets
         if isinstance(data, datasets.utils.Dataset):
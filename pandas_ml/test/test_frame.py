@@ -197,6 +197,89 @@ class TestModelFrame(tm.TestCase):
         self.assertTrue(mdf.target is None)
         self.assertEqual(mdf.target_name, '.target')
 
+    def test_frame_from_arrays(self):
+        X = np.array([[1., 2.], [3., 4.], [5., 6.]])
+        y = np.array([0, 1, 0])
+
+        mdf = pdml.ModelFrame.from_arrays(X, y, feature_names=['A', 'B'])
+        exp = pdml.ModelFrame(pd.DataFrame(X, columns=['A', 'B']), target=y)
+        self.assertIsInstance(mdf, pdml.ModelFrame)
+        tm.assert_frame_equal(mdf, exp)
+        self.assertEqual(mdf.target_name, '.target')
+
+        # data is copied
+        X[0, 0] = 10.
+        self.assertEqual(mdf.loc[0, 'A'], 1.)
+
+        mdf = pdml.ModelFrame.from_arrays(X, y, target_name='y')
+        tm.assert_index_equal(mdf.columns, pd.Index(['y', 0, 1]))
+        self.assertEqual(mdf.target_name, 'y')
+        self.assertTrue(mdf.has_target())
+        tm.assert_numpy_array_equal(mdf.data.values, X)
+
+        with pytest.raises(ValueError, match='data and target must have same length'):
+            pdml.ModelFrame.from_arrays(X, y[:2])
+        with pytest.raises(ValueError, match='y must be 1-dimensional'):
+            pdml.ModelFrame.from_arrays(X, X)
+        with pytest.raises(ValueError, match='data and target must have unique names'):
+            pdml.ModelFrame.from_arrays(X, y, feature_names=['A', 'B'], target_name='A')
+
+    def test_frame_init_memory_efficient(self):
+        df = pd.DataFrame({'A': [1, 2, 300],
+                           'B': [0.5, 1.5, np.nan],
+                           'C': [0.1, 0.2, 0.3],
+                           'D': ['x', 'y', 'z']},
+                          columns=['A', 'B', 'C', 'D'])
+        s = pd.Series([0, 1, 0], name='.target')
+
+        mdf = pdml.ModelFrame(df, target=s, memory_efficient=True)
+        exp = [np.int8, np.int16, np.float32, np.float64, np.object_]
+        self.assertEqual(mdf.dtypes.tolist(), [np.dtype(d) for d in exp])
+        self.assert_numpy_array_almost_equal(mdf.data[['A', 'B', 'C']].values,
+                                             df[['A', 'B', 'C']].values)
+        tm.assert_numpy_array_equal(mdf.target.values, s.values.astype(np.int8))
+
+        # not downcasted by default
+        mdf = pdml.ModelFrame(df, target=s)
+        exp = [np.int64, np.int64, np.float64, np.float64, np.object_]
+        self.assertEqual(mdf.dtypes.tolist(), [np.dtype(d) for d in exp])
+
+        # float values out of float32 range
+        df = pd.DataFrame({'A': [1e300, 2.], 'B': [0.5, 1.5]}, columns=['A', 'B'])
+        with tm.assert_produces_warning(None):
+            mdf = pdml.ModelFrame(df, target=[1, 0], memory_efficient=True)
+        exp = [np.int8, np.float64, np.float32]
+        self.assertEqual(mdf.dtypes.tolist(), [np.dtype(d) for d in exp])
+        tm.assert_numpy_array_equal(mdf['A'].values, df['A'].values)
+
+        # empty
+        df = pd.DataFrame({'A': pd.Series([], dtype='int64'),
+                           'B': pd.Series([], dtype='float64')},
+                          columns=['A', 'B'])
+        s = pd.Series([], dtype='int64', name='t')
+        mdf = pdml.ModelFrame(df, target=s, memory_efficient=True)
+        tm.assert_index_equal(mdf.columns, pd.Index(['t', 'A', 'B']))
+        exp = [np.int8, np.int8, np.float32]
+        self.assertEqual(mdf.dtypes.tolist(), [np.dtype(d) for d in exp])
+
+        # duplicated columns and multi targets
+        df = pd.DataFrame([[1, 0.5], [2, 1.5]], columns=['A', 'A'])
+        t = pd.DataFrame([[1, 2], [3, 4]], columns=['t1', 't2'])
+        mdf = pdml.ModelFrame(df, target=t, memory_efficient=True)
+        tm.assert_index_equal(mdf.columns, pd.Index(['t1', 't2', 'A', 'A']))
+        exp = [np.int8, np.int8, np.int8, np.float32]
+        self.assertEqual(mdf.dtypes.tolist(), [np.dtype(d) for d in exp])
+
+    def test_frame_init_df_multiindex_columns(self):
+        columns = pd.MultiIndex.from_tuples([('a', 'x'), ('a', 'y')])
+        df = pd.DataFrame([[1, 2], [3, 4]], columns=columns)
+
+        mdf = pdml.ModelFrame(df, target=[0, 1])
+        tm.assert_index_equal(mdf.columns, pd.Index(['.target', ('a', 'x'), ('a', 'y')]))
+        self.assertEqual(mdf.target_name, '.target')
+        tm.assert_numpy_array_equal(mdf.target.values, np.array([0, 1]))
+        tm.assert_numpy_array_equal(mdf.data.values, df.values)
+
     def test_frame_init_df_duplicated(self):
         # initialization by dataframe and duplicated target
         df = pd.DataFrame({'A': [1, 2, 3],
@@ -355,6 +438,40 @@ class TestModelFrame(tm.TestCase):
         with pytest.raises(TypeError):
             df.data = [1, 2, 3]
 
+    def test_get_method_mapper(self):
+        import sklearn.cross_decomposition as cd
+
+        df = pdml.ModelFrame({'A': [1., 2., 3.], 'B': [2., 4., 5.]}, target=[1., 2., 3.])
+        est = cd.PLSRegression()
+        self.assertTrue(callable(df._get_method_mapper(est, 'fit')))
+        self.assertTrue(df._get_method_mapper(est, 'transform') is None)
+        # methods without any mappings
+        self.assertTrue(df._get_method_mapper(est, 'score') is None)
+
+    def test_frame_data_columns_cache(self):
+        df = pdml.ModelFrame({'A': [1, 2, 3],
+                              'B': [4, 5, 6]},
+                             target=[7, 8, 9],
+                             index=['a', 'b', 'c'])
+        tm.assert_index_equal(df.data.columns, pd.Index(['A', 'B']))
+
+        df['C'] = [1, 1, 1]
+        tm.assert_index_equal(df.data.columns, pd.Index(['A', 'B', 'C']))
+
+        del df['A']
+        tm.assert_index_equal(df.data.columns, pd.Index(['B', 'C']))
+
+        df.columns = ['X', 'B', 'C']
+        self.assertFalse(df.has_target())
+        tm.assert_index_equal(df.data.columns, pd.Index(['X', 'B', 'C']))
+
+        df.target_name = 'X'
+        self.assertTrue(df.has_target())
+        tm.assert_index_equal(df.data.columns, pd.Index(['B', 'C']))
+
+        df.drop('C', axis=1, inplace=True)
+        tm.assert_index_equal(df.data.columns, pd.Index(['B']))
+
     def test_frame_target_proparty(self):
         df = pd.DataFrame({'A': [1, 2, 3],
                            'B': [4, 5, 6],
@@ -611,8 +728,85 @@ class TestModelFrame(tm.TestCase):
             tm.assert_index_equal(result.index, df.index)
             self.assert_numpy_array_almost_equal(result.values, expected)
 
+            # warned only once per estimator class
+            df._predicted = None
+            with tm.assert_produces_warning(None):
+                result = df.predicted
+            self.assert_numpy_array_almost_equal(result.values, mod2.predict(iris.data))
+
         warnings.simplefilter("default")
 
+    def test_call_values_updated(self):
+        import sklearn.linear_model as lm
+
+        df = pdml.ModelFrame({'A': [1., 2., 3., 4.],
+                              'B': [4., 1., 6., 3.]},
+                             target=[1., 3., 2., 5.])
+        mod = lm.LinearRegression()
+        df.fit(mod)
+        exp = lm.LinearRegression().fit(df.data.values, df.target.values)
+        self.assert_numpy_array_almost_equal(mod.coef_, exp.coef_)
+
+        # values are changed without changing columns
+        df.iloc[0, 1] = 10.
+        df['B'] = [2., 2., 1., 1.]
+        df.fit(mod)
+        exp = lm.LinearRegression().fit(np.array([[10., 2.], [2., 2.], [3., 1.], [4., 1.]]),
+                                        np.array([1., 3., 2., 5.]))
+        self.assert_numpy_array_almost_equal(mod.coef_, exp.coef_)
+
+        df.target = [2., 1., 2., 1.]
+        df.fit(mod)
+        exp = lm.LinearRegression().fit(df.data.values, np.array([2., 1., 2., 1.]))
+        self.assert_numpy_array_almost_equal(mod.coef_, exp.coef_)
+
+        # chained assignment doesn't notify ModelFrame
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df['A'][0] = 50.
+        df.fit(mod)
+        exp = lm.LinearRegression().fit(np.array([[50., 2.], [2., 2.], [3., 1.], [4., 1.]]),
+                                        np.array([2., 1., 2., 1.]))
+        self.assert_numpy_array_almost_equal(mod.coef_, exp.coef_)
+
+    def test_wrap_ndarray(self):
+        df = pdml.ModelFrame({'A': [1., 2., 3.], 'B': [2., 4., 5.]},
+                             target=[1, 0, 1], index=['a', 'b', 'c'])
+
+        result = df._wrap_ndarray(np.array([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]]),
+                                  columns=[0, 1])
+        expected = pdml.ModelFrame([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]],
+                                   index=['a', 'b', 'c'], columns=[0, 1])
+        self.assertIsInstance(result, pdml.ModelFrame)
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result.target_name, '.target')
+        self.assertFalse(result.has_target())
+
+        result = df._wrap_ndarray(np.array([['x', 'y'], ['y', 'x'], ['x', 'x']]))
+        expected = pdml.ModelFrame([['x', 'y'], ['y', 'x'], ['x', 'x']],
+                                   index=['a', 'b', 'c'])
+        self.assertIsInstance(result, pdml.ModelFrame)
+        tm.assert_frame_equal(result, expected)
+
+    def test_call_estimator_without_copy(self):
+        import sklearn.cluster as cluster
+        import sklearn.linear_model as lm
+
+        df = pdml.ModelFrame({'A': [1., 2., 3., 4.],
+                              'B': [4., 1., 6., 3.]},
+                             target=[1., 3., 2., 5.])
+        expected = df.copy()
+
+        # estimators may modify passed values inplace
+        mod = lm.LinearRegression(copy_X=False)
+        df.fit(mod)
+        exp = lm.LinearRegression().fit(expected.data.values, expected.target.values)
+        self.assert_numpy_array_almost_equal(mod.coef_, exp.coef_)
+        tm.assert_frame_equal(df, expected)
+
+        df.fit(cluster.KMeans(2, copy_x=False, random_state=self.random_state))
+        tm.assert_frame_equal(df, expected)
+
     def test_frame_metadata(self):
         df = pd.DataFrame({'A': [1, 2, 3],
                            'B': [4, 5, 6],
@@ -646,6 +840,19 @@ class TestModelFrame(tm.TestCase):
         self.assertTrue(sliced.has_target())
         self.assertEqual(sliced.target_name, 'A')
 
+        # initialization by ModelFrame keeps target_name
+        result = pdml.ModelFrame(mdf)
+        self.assertIsInstance(result, pdml.ModelFrame)
+        self.assertTrue(result.has_target())
+        self.assertEqual(result.target_name, 'A')
+        tm.assert_frame_equal(result, mdf)
+
+        result = pdml.ModelFrame(mdf, copy=True)
+        self.assertIsInstance(result, pdml.ModelFrame)
+        self.assertTrue(result.has_target())
+        self.assertEqual(result.target_name, 'A')
+        tm.assert_frame_equal(result, mdf)
+
 
 class TestModelFrameMultiTarges(tm.TestCase):
 
@@ -660,6 +867,22 @@ class TestModelFrameMultiTarges(tm.TestCase):
         self.assertIsInstance(test_df, pdml.ModelFrame)
         self.assertIsInstance(train_df.iloc[:, 2:3], pdml.ModelFrame)
 
+    def test_frame_accessor_cached(self):
+        df = pdml.ModelFrame({'A': [1, 2, 3]}, target=[0, 1, 0])
+
+        accessor = df.svm
+        self.assertTrue(df.svm is accessor)
+        # aliases refer to the same accessor
+        self.assertTrue(df.da is df.discriminant_analysis)
+        self.assertTrue(df.target.pp is df.target.preprocessing)
+
+        with pytest.raises(AttributeError):
+            df.svm = 1
+        with pytest.raises(AttributeError):
+            df.da = 1
+        self.assertTrue(df.svm is accessor)
+        tm.assert_index_equal(df.columns, pd.Index(['.target', 'A']))
+
     def test_frame_init_df_df(self):
         # initialization by dataframe and dataframe
         df = pd.DataFrame({'A': [1, 2, 3],
@@ -709,6 +932,33 @@ class TestModelFrameMultiTarges(tm.TestCase):
         tm.assert_series_equal(mdf.target, target)
         self.assertEqual(mdf.target_name, 't1')
 
+    def test_frame_target_setter_leading_target(self):
+        df = pd.DataFrame({'A': [1, 2, 3],
+                           'B': [4, 5, 6]},
+                          index=['a', 'b', 'c'],
+                          columns=['A', 'B'])
+
+        # target column is replaced inplace
+        mdf = pdml.ModelFrame(df, target=pd.Series([1, 0, 1], index=['a', 'b', 'c']))
+        self.assertTrue(mdf._has_single_leading_target())
+        mdf.target = pd.Series([0.5, 1.5, 2.5], index=['a', 'b', 'c'], name='.target')
+        tm.assert_index_equal(mdf.columns, pd.Index(['.target', 'A', 'B']))
+        self.assertEqual(mdf.target_name, '.target')
+        self.assertEqual(mdf.target.dtype, np.float64)
+        tm.assert_series_equal(mdf.target, pdml.ModelSeries([0.5, 1.5, 2.5], index=['a', 'b', 'c'],
+                                                            name='.target'))
+        tm.assert_frame_equal(mdf.data, pdml.ModelFrame(df))
+
+        # target is not the first column, data and target are concatenated
+        mdf = pdml.ModelFrame(df, target='B')
+        self.assertFalse(mdf._has_single_leading_target())
+        mdf.target = pd.Series([7., 8., 9.], index=['a', 'b', 'c'], name='B')
+        tm.assert_index_equal(mdf.columns, pd.Index(['B', 'A']))
+        self.assertEqual(mdf.target_name, 'B')
+        tm.assert_series_equal(mdf.target, pdml.ModelSeries([7., 8., 9.], index=['a', 'b', 'c'],
+                                                            name='B'))
+        tm.assert_frame_equal(mdf.data, pdml.ModelFrame(df[['A']]))
+
     def test_frame_init_df_target_setter(self):
         # initialization by dataframe and dataframe
         df = pd.DataFrame({'A': [1, 2, 3],
@@ -1,3 +1,4 @@
 #!/usr/bin/env python
 
 from pandas_ml.util._util import _is_1d_varray, _is_1d_harray   # noqa
+from pandas_ml.util._util import _downcast_numeric              # noqa
@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+import numpy as np
+import pandas as pd
+
 
 def _is_1d_varray(arr):
     """
@@ -13,3 +16,32 @@ def _is_1d_harray(arr):
     Check whether the array has single dimension like (x, ) or (1, x)
     """
     return len(arr.shape) < 2 or arr.shape[0] == 1
+
+
+def _downcast_numeric(values):
+    """
+    Downcast numeric Series to the smallest dtype which can hold its values
+    without loss, or return as it is. DataFrame is downcasted per column.
+    """
+    if isinstance(values, pd.DataFrame):
+        # DataFrame.apply doesn't call func on columns of empty DataFrame,
+        # refer columns by position to keep order and duplicated columns
+        ncols = len(values.columns)
+        result = pd.DataFrame({i: _downcast_numeric(values.iloc[:, i]) for i in range(ncols)},
+                              index=values.index, columns=list(range(ncols)))
+        result.columns = values.columns
+        return result
+
+    kind = values.dtype.kind
+    if kind == 'i':
+        return pd.to_numeric(values, downcast='integer')
+    elif kind == 'u':
+        return pd.to_numeric(values, downcast='unsigned')
+    elif kind == 'f' and values.dtype.itemsize > 4:
+        # pd.to_numeric allows small differences when downcasting floats
+        with np.errstate(over='ignore'):
+            # values out of float32 range become inf and are not downcasted
+            downcasted = values.astype(np.float32)
+        if ((downcasted == values) | values.isnull()).all():
+            return downcasted
+    return values
@@ -16,7 +16,7 @@ conda create -n myenv "python=$PYTHON"
 source activate myenv
 conda install openblas
 conda install numpy scipy matplotlib "scikit-learn=$SKLEARN" "pandas=$PANDAS"
-conda install patsy statsmodels seaborn
+conda install patsy statsmodels seaborn numexpr
 
 python -m pip install graphviz
 python -m pip install xgboost